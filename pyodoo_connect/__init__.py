@@ -9,6 +9,7 @@
 
 
 from .odoo import connect_odoo
+from .async_odoo import AsyncOdooAPI, connect_odoo_async
 from .tools import Command
 
 __version__ = "0.1.6"
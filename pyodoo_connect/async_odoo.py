@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+#############################################################################
+# Author: Fasil
+# Email: fasilwdr@hotmail.com
+# WhatsApp: https://wa.me/966538952934
+# Facebook: https://www.facebook.com/fasilwdr
+# Instagram: https://www.instagram.com/fasilwdr
+#############################################################################
+import asyncio
+import itertools
+import logging
+from typing import Optional, Any, List, Dict, Tuple, AsyncIterator
+import httpx
+
+from .odoo import (
+    OdooException,
+    OdooConnectionError,
+    OdooAuthenticationError,
+    OdooRequestError,
+    OdooValidationError,
+    _JSON_HEADERS,
+    _merge_context,
+    _set_context,
+    _with_context,
+    _ModelCache,
+    _HTTP2,
+    _cached_session,
+    _drop_session,
+    _session_key,
+    _store_session,
+    _KEEPALIVE_EXPIRY,
+    _is_session_expired,
+    _TIMEOUT,
+    _dumps,
+    _loads,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncOdooModel:
+    def __init__(self, api, model: str, context: dict = None):
+        self._api = api
+        self._model = model
+        self._context = context or api.context
+
+    def with_context(self, *args, **kwargs) -> 'AsyncOdooModel':
+        context = _with_context(self._context, args, kwargs)
+        return self if context is None else AsyncOdooModel(self._api, self._model, context)
+
+    def __getattr__(self, name):
+        # Odoo refuses to call private methods remotely; underscore names are protocol probes
+        if name.startswith('_'):
+            raise AttributeError(name)
+        call_kw, model, context = self._api._call_kw, self._model, self._context
+
+        async def method_call(*args, **kwargs):
+            return await call_kw(model, name, list(args), _set_context(context, kwargs))
+
+        return method_call
+
+    async def _call(self, method: str, args: List, kwargs: Dict = None) -> Any:
+        return await self._api._call_kw(self._model, method, args, _merge_context(self._context, kwargs))
+
+    async def search(self, domain: List = None, offset: int = 0, limit: Optional[int] = None,
+                     order: Optional[str] = None) -> List[int]:
+        return await self._call('search', [domain or []], {
+            "offset": offset,
+            "limit": limit,
+            "order": order,
+        })
+
+    async def search_read(self, domain: List = None, fields: List[str] = None,
+                          offset: int = 0, limit: Optional[int] = None,
+                          order: Optional[str] = None) -> List[Dict]:
+        return await self._call('search_read', [domain or []], {
+            "fields": fields or ['name'],
+            "offset": offset,
+            "limit": limit,
+            "order": order,
+        }) or []
+
+    async def iter_search_read(self, domain: List = None, fields: List[str] = None,
+                               order: Optional[str] = None, chunk: int = 1000) -> AsyncIterator[Dict]:
+        """Yield matching records, fetching them ``chunk`` rows per request; see :meth:`OdooModel.iter_search_read`"""
+        if chunk <= 0:
+            raise OdooValidationError("chunk must be a positive number of rows")
+        offset = 0
+        page = asyncio.ensure_future(self.search_read(domain, fields, offset=offset, limit=chunk, order=order or 'id'))
+        try:
+            while True:
+                records = await page
+                if len(records) < chunk:
+                    for record in records:
+                        yield record
+                    return
+                offset += chunk
+                page = asyncio.ensure_future(
+                    self.search_read(domain, fields, offset=offset, limit=chunk, order=order or 'id'))
+                for record in records:
+                    yield record
+        finally:
+            page.cancel()  # Consumer stopped early: drop the prefetched page
+
+    async def read(self, ids: List[int], fields: List[str] = None) -> List[Dict]:
+        return await self._call('read', [ids], {"fields": fields or ['name']}) or []
+
+    async def create(self, values: Dict) -> int:
+        result = await self._call('create', [values])
+        if not result:
+            raise OdooValidationError("Create operation returned no ID")
+        return result
+
+    async def write(self, ids: List[int], values: Dict) -> bool:
+        return await self._call('write', [ids, values])
+
+    async def unlink(self, ids: List[int]) -> bool:
+        return await self._call('unlink', [ids])
+
+    async def parallel(self, calls: List[tuple]) -> List[Any]:
+        """Run several independent calls on the model concurrently; see :meth:`OdooModel.parallel`"""
+        calls = [tuple(call) + (None,) * (3 - len(call)) for call in calls]
+        return await asyncio.gather(*[self._call(method, list(args or []), kwargs) for method, args, kwargs in calls])
+
+    async def bulk_call(self, method: str, args_list: List[List], kwargs: Dict = None,
+                        max_concurrency: int = 16) -> List[Any]:
+        """
+        Call ``method`` once per entry of ``args_list`` with a bounded number of requests in flight.
+
+        httpx.AsyncClient degrades under very high concurrency, so the fan-out is
+        capped by a semaphore rather than launching every call at once.
+
+        Args:
+            method: Model method to call
+            args_list: Positional arguments for each call
+            kwargs: Keyword arguments shared by all calls
+            max_concurrency: Maximum number of concurrent requests
+
+        Returns:
+            list: One entry per call, in order; failed calls yield their exception instead of raising
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(args):
+            async with semaphore:
+                return await self._call(method, list(args), kwargs)
+
+        return await asyncio.gather(*[call(args) for args in args_list], return_exceptions=True)
+
+
+class AsyncOdooAPI:
+    """
+    Asynchronous counterpart of :class:`OdooAPI` built on ``httpx.AsyncClient``.
+
+    Every RPC is a coroutine, so independent calls can be awaited together with
+    ``asyncio.gather`` and share the client's pooled connections.
+    """
+
+    def __init__(self, url: str, db: str = None, username: str = None, password: str = None,
+                 session_id: str = None, max_connections: int = 64):
+        if not url:
+            raise OdooValidationError("URL cannot be empty")
+        if not (session_id or (db and username and password)):
+            raise OdooValidationError("Either session_id or (db, username, password) must be provided")
+
+        self.url = url.rstrip('/')
+        self.db = db
+        self.username = username
+        self.password = password
+        self.session_id = session_id
+        self.context = {
+            "lang": "en_US",
+            "tz": "Asia/Riyadh",
+            "uid": None
+        }
+        self._session_key = _session_key(self.url, db, username, password)
+        self._models = _ModelCache(self, AsyncOdooModel)
+        self._rpc_id = itertools.count(1)  # JSON-RPC request ids, unique per API instance
+        self._login_lock = asyncio.Lock()  # Lets one task log in while concurrent calls wait for it
+        try:
+            self._client = httpx.AsyncClient(
+                verify=False,
+                http2=_HTTP2,
+                headers=_JSON_HEADERS,
+                timeout=_TIMEOUT,
+                # Keep every connection alive so concurrent bursts reuse them (or their
+                # HTTP/2 streams) instead of handshaking again after each burst
+                limits=httpx.Limits(
+                    max_keepalive_connections=max_connections,
+                    max_connections=max_connections,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY
+                )
+            )
+        except Exception as e:
+            raise OdooConnectionError(f"Failed to initialize HTTP client: {str(e)}")
+        self._client_post = self._client.post
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._session_id
+
+    @session_id.setter
+    def session_id(self, value: Optional[str]):
+        self._session_id = value
+        # Cookie header sent with every request, rebuilt only when the session changes
+        self._session_headers = {'Cookie': f'session_id={value}'} if value else {}
+
+    async def __aenter__(self) -> 'AsyncOdooAPI':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client and release pooled connections"""
+        await self._client.aclose()
+
+    def env(self, model: str) -> AsyncOdooModel:
+        return self._models[model]
+
+    async def _post(self, endpoint: str, payload: dict) -> httpx.Response:
+        try:
+            return await self._client_post(self.url + endpoint, headers=self._session_headers, content=_dumps(payload))
+        except httpx.TimeoutException:
+            raise OdooConnectionError("Request timed out")
+        except httpx.HTTPError as e:
+            raise OdooConnectionError(f"HTTP error occurred: {str(e)}")
+
+    async def validate_session(self) -> bool:
+        if not self.session_id:
+            return False
+        response = await self._post("/web/session/get_session_info", {"jsonrpc": "2.0", "params": {}})
+        if response.status_code == 200:
+            uid = (_loads(response.content).get('result') or {}).get('uid')
+            if uid:
+                self.context['uid'] = uid
+                return True
+        return False
+
+    async def connect(self) -> bool:
+        if self.session_id and await self.validate_session():
+            return True
+        if not (self.db and self.username and self.password):
+            return False
+        cached = _cached_session(self._session_key)
+        if cached and cached[0] != self.session_id:
+            self.session_id, self.context['uid'] = cached
+            return True
+
+        payload = {
+            "jsonrpc": "2.0",
+            "params": {
+                "db": self.db,
+                "login": self.username,
+                "password": self.password
+            }
+        }
+        response = await self._post("/web/session/authenticate", payload)
+        if response.status_code == 200:
+            result = _loads(response.content)
+            if result.get('result'):
+                self.session_id = response.cookies.get('session_id')
+                self.context['uid'] = result['result'].get('uid')
+                if self.session_id:
+                    _store_session(self._session_key, self.session_id, self.context['uid'])
+                return True
+        return False
+
+    async def _ensure_session(self):
+        if not self.session_id:
+            async with self._login_lock:
+                if not self.session_id and not await self.connect():
+                    raise OdooAuthenticationError("Failed to establish or validate session")
+
+    async def _reauthenticate(self, rejected: Optional[str], expired: bool = False):
+        """Re-establish the session after the server rejected it; see :meth:`OdooAPI._reauthenticate`"""
+        async with self._login_lock:
+            if self.session_id != rejected:
+                return  # Another task already logged in again while this request was in flight
+            _drop_session(self._session_key, rejected)
+            if expired:
+                self.session_id = None
+            if not await self.connect():
+                raise OdooAuthenticationError("Session expired and re-authentication failed")
+
+    async def _make_request(self, endpoint: str, payload: dict) -> dict:
+        await self._ensure_session()
+
+        payload["jsonrpc"] = "2.0"
+        payload.setdefault("id", next(self._rpc_id))
+        session_id = self.session_id
+        json_response = await self._send(endpoint, payload)
+        if _is_session_expired(json_response):
+            await self._reauthenticate(session_id, expired=True)
+            json_response = await self._send(endpoint, payload)
+        if 'error' in json_response:
+            error_data = json_response['error']
+            error_msg = error_data.get('data', {}).get('message', str(error_data))
+            raise OdooRequestError(f"Odoo server error: {error_msg}", error_data)
+        return json_response
+
+    async def _send(self, endpoint: str, payload: dict) -> dict:
+        """Post ``payload`` and decode the JSON-RPC response; see :meth:`OdooAPI._send`"""
+        session_id = self.session_id
+        response = await self._post(endpoint, payload)
+        if response.status_code in (401, 403):
+            await self._reauthenticate(session_id)
+            response = await self._post(endpoint, payload)
+        if response.status_code != 200:
+            raise OdooRequestError(f"Request failed with status code: {response.status_code}")
+        try:
+            return _loads(response.content)
+        except ValueError as e:
+            raise OdooRequestError(f"Invalid JSON response: {str(e)}")
+
+    async def call_kw(self, model: str, method: str, args: List = None, kwargs: Dict = None) -> Any:
+        """Call ``method`` on ``model`` through ``/web/dataset/call_kw`` and return its result"""
+        kwargs = dict(kwargs or {})
+        kwargs.setdefault('context', self.context)
+        return await self._call_kw(model, method, list(args or []), kwargs)
+
+    async def _call_kw(self, model: str, method: str, args: list, kwargs: dict) -> Any:
+        """:meth:`call_kw` for internal callers, whose freshly built ``args`` and ``kwargs`` go into the payload as is"""
+        response = await self._make_request(f"/web/dataset/call_kw/{model}/{method}", {
+            "jsonrpc": "2.0",
+            "id": next(self._rpc_id),
+            "method": "call",
+            "params": {"model": model, "method": method, "args": args, "kwargs": kwargs}
+        })
+        return response.get("result", False)
+
+    async def download_report(self, report_name: str, ids: List[int], filename: str,
+                              report_type: str = 'pdf') -> str:
+        """Render a report and stream it to disk in 64 KiB chunks; see :meth:`OdooAPI.download_report`"""
+        await self._ensure_session()
+        url = f"{self.url}/report/{report_type}/{report_name}/{','.join(str(id_) for id_ in ids)}"
+
+        try:
+            for attempt in range(2):
+                session_id = self.session_id
+                async with self._client.stream('GET', url, headers=self._session_headers, timeout=120) as response:
+                    if not attempt and (response.is_redirect or response.status_code in (401, 403)):
+                        await self._reauthenticate(session_id, expired=response.is_redirect)
+                        continue
+                    response.raise_for_status()
+                    with open(filename, 'wb') as f:
+                        async for chunk in response.aiter_bytes(65536):
+                            f.write(chunk)
+                    return filename
+        except httpx.TimeoutException:
+            raise OdooConnectionError("Report download timed out")
+        except httpx.HTTPError as e:
+            raise OdooConnectionError(f"Report download failed: {str(e)}")
+
+    async def download_reports(self, jobs: List[Tuple[str, List[int], str]], max_concurrency: int = 8) -> List[str]:
+        """Download several reports concurrently; see :meth:`OdooAPI.download_reports`"""
+        await self._ensure_session()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def download(job):
+            async with semaphore:
+                return await self.download_report(*job)
+
+        return await asyncio.gather(*[download(job) for job in jobs])
+
+    async def gather_reads(self, reads: List[Tuple[str, List[int], List[str]]]) -> List[List[Dict]]:
+        """
+        Run several ``read`` calls concurrently.
+
+        Args:
+            reads: ``(model, ids, fields)`` tuples
+
+        Returns:
+            list: One list of record dicts per entry of ``reads``, in order
+        """
+        return await asyncio.gather(*[self.env(model).read(ids, fields) for model, ids, fields in reads])
+
+
+async def connect_odoo_async(url: str, db: str = None, username: str = None, password: str = None,
+                             session_id: str = None, max_connections: int = 64
+                             ) -> Tuple[Optional[AsyncOdooAPI], Optional[str]]:
+    """
+    Asynchronously connect to Odoo using either credentials or session ID.
+
+    Returns:
+        tuple: (AsyncOdooAPI instance, session_id) or (None, None) if connection fails
+    """
+    try:
+        api = AsyncOdooAPI(url=url, db=db, username=username, password=password, session_id=session_id,
+                           max_connections=max_connections)
+        if await api.connect():
+            return api, api.session_id
+        await api.aclose()
+        raise OdooAuthenticationError("Failed to connect to Odoo server")
+    except OdooException as e:
+        _logger.error("Connection failed: %s", e)
+        return None, None
@@ -1,7 +1,91 @@
+import base64
+import glob
+import hashlib
+import itertools
+import logging
+import os
+import threading
 import time
-from typing import Optional, Any, List, Dict, Union
+import weakref
+from collections import ChainMap, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Optional, Any, List, Dict, Union, Iterator, Mapping
 import httpx
 
+_logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  httpx negotiates HTTP/2 only when h2 is installed
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+def _odoo_default(value: Any) -> Any:
+    """Encode values JSON has no type for the way Odoo expects them in RPC arguments"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, ChainMap):
+        return dict(value)  # Contexts derived with with_context()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode('ascii')  # Binary fields take base64 text
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    # Datetimes go through _odoo_default: Odoo rejects orjson's ISO 8601 format
+    _DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_odoo_default, option=_DUMPS_OPTIONS)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), default=_odoo_default).encode('utf-8')
+
+    _loads = json.loads
+
+# Default timeouts: fail fast on unreachable hosts, allow slow server-side work
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Idle pooled connections are kept this long, just under nginx's default 75s keepalive_timeout,
+# so scripts that pause between bursts of RPCs still reuse their TCP/TLS sessions
+_KEEPALIVE_EXPIRY = 60.0
+
+# Headers shared by every JSON-RPC request; built once instead of per call
+_JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+
+# Methods that never modify data; any other call invalidates cached results
+_READ_ONLY_METHODS = frozenset([
+    'read', 'search', 'search_read', 'search_count', 'fields_get', 'name_search',
+    'name_get', 'read_group', 'default_get', 'check_access_rights',
+])
+
+# Field types left out of record prefetching: potentially large or unbounded values
+_NO_PREFETCH_TYPES = frozenset(['binary', 'one2many', 'many2many'])
+
+# Most records loaded by a single prefetching read, as in Odoo's ORM
+_PREFETCH_MAX = 1000
+
 
 class OdooException(Exception):
     """Base exception class for Odoo API errors"""
@@ -29,213 +113,634 @@ class OdooValidationError(OdooException):
     """Raised when data validation fails"""
     pass
 
+def _freeze(value: Any) -> Any:
+    """Convert nested lists/tuples/dicts into hashable tuples usable as cache keys"""
+    if isinstance(value, (dict, ChainMap)):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    if isinstance(value, set):
+        return tuple(sorted(_freeze(val) for val in value))
+    return value
+
+
+class ResultCache:
+    """
+    Time-bounded LRU cache for results of read-only RPCs.
+
+    Disabled when ``ttl`` is 0. At most ``maxsize`` results are kept, evicting
+    the least recently used ones first. Any call to a method outside the read-only set
+    through the owning API clears the whole cache, since Odoo methods may
+    touch records of other models as well.
+
+    Results are stored encoded and decoded on every hit, so callers modifying
+    a returned list or dict never alter what later callers get.
+    """
+
+    def __init__(self, ttl: float = 0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (expires_at, encoded result), least recently used first
+        # Calls run on worker threads too (call_batch, pipeline, parallel), and any of them may clear the cache
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+        return _loads(entry[1])
+
+    def set(self, key: tuple, value: Any):
+        if self.ttl > 0:
+            entry = (time.monotonic() + self.ttl, _dumps(value))
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# (url, db, model, uid, lang, allfields, attributes) -> fields_get result, shared by all API instances
+_FIELDS_MEMORY = {}
+
+
+class FieldsCache:
+    """
+    Cache of ``fields_get`` results shared by every API connected to the same database.
+
+    Entries are kept per user and language, because Odoo leaves out fields
+    the user's groups cannot access and translates labels.
+
+    Results are kept in process memory and, when ``directory`` is given, also
+    persisted as JSON files that are reused by later processes for ``ttl`` seconds.
+    """
+
+    def __init__(self, url: str, db: Optional[str], directory: Optional[str] = None, ttl: float = 86400):
+        self._prefix = (url, db)
+        self._directory = None
+        if directory:
+            digest = hashlib.sha1(f"{url}|{db}".encode('utf-8')).hexdigest()[:16]
+            self._directory = os.path.join(os.path.expanduser(directory), digest)
+        self.ttl = ttl
+
+    def _path(self, model: str, uid: Optional[int], lang: Optional[str], allfields: tuple, attributes: tuple) -> str:
+        digest = hashlib.sha1(repr((uid, lang, allfields, attributes)).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self._directory, f"{model}-{digest}.json")
+
+    def get(self, model: str, uid: Optional[int], lang: Optional[str], allfields: tuple,
+            attributes: tuple) -> Optional[Dict]:
+        key = self._prefix + (model, uid, lang, allfields, attributes)
+        fields = _FIELDS_MEMORY.get(key)
+        if fields is None and self._directory:
+            try:
+                with open(self._path(model, uid, lang, allfields, attributes), 'rb') as f:
+                    entry = _loads(f.read())
+                if time.time() - entry['fetched_at'] < self.ttl:
+                    fields = _FIELDS_MEMORY[key] = entry['fields']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        return fields
+
+    def set(self, model: str, uid: Optional[int], lang: Optional[str], allfields: tuple, attributes: tuple,
+            fields: Dict):
+        _FIELDS_MEMORY[self._prefix + (model, uid, lang, allfields, attributes)] = fields
+        if self._directory:
+            path = self._path(model, uid, lang, allfields, attributes)
+            try:
+                os.makedirs(self._directory, exist_ok=True)
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(_dumps({'fetched_at': time.time(), 'fields': fields}))
+                os.replace(path + '.tmp', path)
+            except OSError:
+                pass
+
+    def invalidate(self, model: str):
+        """Drop cached definitions of ``model`` from memory and disk"""
+        for key in [key for key in _FIELDS_MEMORY if key[:3] == self._prefix + (model,)]:
+            _FIELDS_MEMORY.pop(key, None)
+        if self._directory:
+            for path in glob.glob(os.path.join(glob.escape(self._directory), f"{glob.escape(model)}-*.json")):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+# (url, db, login, password digest) -> (session_id, uid, reuse_until), shared by all API instances
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+_SESSION_REUSE = 1800  # Seconds a login is reused by APIs created later for the same user
+
+
+def _session_key(url: str, db: Optional[str], username: Optional[str], password: Optional[str]) -> tuple:
+    # The password is part of the key so a wrong one never picks up another API's session
+    return url, db, username, hashlib.sha256((password or '').encode('utf-8')).hexdigest()
+
+
+def _cached_session(key: tuple) -> Optional[tuple]:
+    """Return ``(session_id, uid)`` of a recent login with the same credentials, if any"""
+    with _SESSIONS_LOCK:
+        entry = _SESSIONS.get(key)
+        if entry is None:
+            return None
+        if entry[2] < time.monotonic():
+            del _SESSIONS[key]
+            return None
+        return entry[:2]
+
+
+def _store_session(key: tuple, session_id: str, uid: Optional[int]):
+    with _SESSIONS_LOCK:
+        _SESSIONS[key] = (session_id, uid, time.monotonic() + _SESSION_REUSE)
+
+
+def _drop_session(key: tuple, session_id: Optional[str]):
+    """Forget ``session_id`` after the server rejected it, unless another API already replaced it"""
+    with _SESSIONS_LOCK:
+        if session_id and _SESSIONS.get(key, (None,))[0] == session_id:
+            del _SESSIONS[key]
+
+
+def _is_session_expired(response: dict) -> bool:
+    """Whether a JSON-RPC response reports that the session is no longer valid"""
+    error = response.get('error')
+    if not error:
+        return False
+    return error.get('code') == 100 or 'SessionExpired' in (error.get('data') or {}).get('name', '')
+
+
+def _extend_context(context: Mapping, values: dict) -> ChainMap:
+    """Return ``context`` overlaid with ``values``, sharing ``context`` instead of copying it"""
+    if isinstance(context, ChainMap):
+        return context.new_child(values)
+    return ChainMap(values, context)
+
+
+def _with_context(context: Mapping, args: tuple, kwargs: dict) -> Optional[ChainMap]:
+    """Build the context of a ``with_context(*args, **kwargs)`` call, or None if it would equal ``context``"""
+    values = dict(args[0]) if args and isinstance(args[0], dict) else {}
+    values.update(kwargs)
+    if all(key in context and context[key] == value for key, value in values.items()):
+        return None
+    return _extend_context(context, values)
+
+
+def _merge_context(context: Mapping, kwargs: Optional[dict]) -> dict:
+    """Return a copy of ``kwargs`` whose context is ``context`` updated with any context it carries"""
+    return _set_context(context, dict(kwargs) if kwargs else {})
+
+
+def _set_context(context: Mapping, kwargs: dict) -> dict:
+    """:func:`_merge_context` in place, for ``kwargs`` dicts built by the caller itself"""
+    call_context = kwargs.get('context')
+    kwargs['context'] = _extend_context(context, call_context) if call_context else context
+    return kwargs
+
+
 class OdooRecord:
-    _field_cache = {}  # Class-level cache for fields
+    __slots__ = ('_api', '_model', '_id', '_values', '_context', '_dirty', '_auto_flush', '_buffering',
+                 '_methods', '_prefetch', '_model_view', '__weakref__')
+    _SLOTS = frozenset(__slots__)
 
-    def __init__(self, api, model: str, record_id: int, values: dict = None, context: dict = None):
+    def __init__(self, api, model: str, record_id: int, values: dict = None, context: dict = None,
+                 auto_flush: bool = True):
         self._api = api
         self._model = model
         self._id = record_id
         self._values = values or {}
         self._context = context or api.context.copy()
-
-        # Initialize model's field cache if not already present
-        if self._model not in self._field_cache:
-            try:
-                self._field_cache[self._model] = set(
-                    self._api.env(self._model).fields_get().keys()
-                )
-            except OdooException as e:
-                self._field_cache[self._model] = set()
-                raise OdooValidationError(f"Failed to fetch fields for model {self._model}: {str(e)}")
+        self._dirty = {}  # Field values assigned but not yet written
+        self._auto_flush = auto_flush
+        self._buffering = 0
+        self._methods = {}  # method name -> bound RPC caller
+        self._prefetch = None  # OdooRecordSet this record was browsed with, if any
+        # Reads, writes and unlinks of the record are sent with its context
+        self._model_view = api.env(model) if self._context is api.context else OdooModel(api, model, self._context)
 
     def with_context(self, *args, **kwargs) -> 'OdooRecord':
         """Return a new record with updated context"""
-        context = self._context.copy()
-
-        # Handle dictionary argument
-        if args and isinstance(args[0], dict):
-            context.update(args[0])
-
-        # Handle keyword arguments
-        context.update(kwargs)
+        context = _with_context(self._context, args, kwargs)
+        if context is None:
+            return self
+        return OdooRecord(self._api, self._model, self._id, self._values.copy(), context,
+                          auto_flush=self._auto_flush)
+
+    def __enter__(self) -> 'OdooRecord':
+        """Buffer attribute assignments until the block exits, then write them at once"""
+        self._buffering += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._buffering -= 1
+        if self._buffering:
+            return
+        if exc_type is not None:
+            self._dirty = {}  # The block failed: its assignments are discarded, never written later
+            return
+        try:
+            self.flush()
+        except OdooException:
+            self._dirty = {}
+            raise
 
-        return OdooRecord(self._api, self._model, self._id, self._values.copy(), context)
+    def batch(self) -> 'OdooRecord':
+        """Return the record for ``with record.batch():``, the explicit spelling of ``with record:``"""
+        return self
 
     def __getattr__(self, name):
-        if name in self._values:
+        # Unset slots and Python protocol probes (copy, pickle, hasattr) are never RPCs
+        if name in OdooRecord._SLOTS or name.startswith('__'):
+            raise AttributeError(name)
+
+        dirty = self._dirty
+        if dirty and name in dirty:
+            return dirty[name]
+        try:
             return self._values[name]
+        except KeyError:
+            pass
 
-        # Check if it's a known field using the cache
-        if name in self._field_cache.get(self._model, set()):
+        if name in self._ensure_fields():
+            # Like Odoo's ORM, load the model's stored fields along with the requested one,
+            # for every record browsed together with this one
+            fields = self._api._prefetch_fields[self._model]
+            fields = fields if name in fields else [name, *fields]
+            # Browsed on its own: load the fields for other such records of the model in the same read
+            records = self._prefetch if self._prefetch is not None else self._model_view._peers(self)
             try:
-                record = self._api.env(self._model).search_read(
-                    domain=[('id', '=', self._id)],
-                    fields=[name]
-                )
-                if record and name in record[0]:
-                    self._values.update(record[0])
-                    return self._values.get(name)
-            except OdooException as e:
-                raise OdooRequestError(f"Failed to fetch field {name}: {str(e)}")
+                _read_into(self._model_view, records, fields)
+            except OdooRequestError:
+                if len(records) == 1:
+                    raise
+                # Another record may be deleted or not readable by the user. Which one is unknown,
+                # so every record of the failed read is read on its own from now on, this one first
+                for record in [record for record in records if any(field not in record._values for field in fields)]:
+                    OdooRecordSet(record._model_view, [record])
+                _read_into(self._model_view, [self], fields)
+            if name in self._values:
+                return self._values[name]
 
         # If not a field, treat it as a method
-        def method_call(*args, **kwargs):
-            try:
-                endpoint = f"/web/dataset/call_kw/{self._model}/{name}"
-                kwargs = kwargs.copy()
-
-                if 'context' in kwargs:
-                    ctx = self._context.copy()
-                    ctx.update(kwargs['context'])
-                    kwargs['context'] = ctx
-                else:
-                    kwargs['context'] = self._context
-
-                payload = {
-                    "params": {
-                        "model": self._model,
-                        "method": name,
-                        "args": [[self._id]] + list(args),
-                        "kwargs": kwargs
-                    }
-                }
-                response = self._api._make_request(endpoint, payload)
-                if not response:
-                    raise OdooRequestError(f"Method call failed: {name}")
-                return response.get("result", False)
-            except OdooException as e:
-                raise OdooRequestError(f"Method call failed: {name} - {str(e)}")
-
+        method_call = self._methods.get(name)
+        if method_call is None:
+            # Bound once here so each call skips the attribute lookups through the record
+            call_kw, model, record_id, context = self._api._call_kw, self._model, self._id, self._context
+
+            def method_call(*args, **kwargs):
+                try:
+                    return call_kw(model, name, [[record_id], *args], _set_context(context, kwargs))
+                except OdooException as e:
+                    raise OdooRequestError(f"Method call failed: {name} - {str(e)}")
+
+            self._methods[name] = method_call
         return method_call
 
+    def _ensure_fields(self) -> set:
+        """Return the model's field names, fetching them on first need instead of when records are created"""
+        try:
+            return self._model_view.field_names()
+        except OdooException as e:
+            raise OdooValidationError(f"Failed to fetch fields for model {self._model}: {str(e)}")
+
     def __setattr__(self, name, value):
         if name.startswith('_'):
             super().__setattr__(name, value)
+        elif self._buffering or not self._auto_flush:
+            # Kept apart from the loaded values until written, so a discarded assignment leaves no trace
+            self._dirty[name] = value
+        elif self._api._write_buffer is not None:
+            self._dirty[name] = value
+            self._api._write_buffer[self] = None
         else:
             try:
-                if self._api.env(self._model).write([self._id], {name: value}):
-                    self._values[name] = value
+                if self._model_view.write([self._id], {name: value}):
+                    self._forget([name])
                 else:
                     raise OdooValidationError(f"Failed to write value for field: {name}")
             except OdooException as e:
                 raise OdooRequestError(f"Failed to set attribute {name}: {str(e)}")
 
+    def flush(self) -> bool:
+        """Write all buffered attribute assignments in a single RPC"""
+        if not self._dirty:
+            return True
+        if self._api._write_buffer is not None:
+            # Inside OdooAPI.batch(): leave the write to the batch
+            self._api._write_buffer[self] = None
+            return True
+        try:
+            result = self._model_view.write([self._id], self._dirty)
+        except OdooException as e:
+            raise OdooRequestError(f"Failed to write fields {', '.join(self._dirty)}: {str(e)}")
+        if not result:
+            raise OdooValidationError(f"Failed to write values for fields: {', '.join(self._dirty)}")
+        self._forget(self._dirty)
+        self._dirty = {}
+        return result
+
+    def prefetch(self, fields: List[str]) -> 'OdooRecord':
+        """Load the given fields in a single read so later attribute access needs no RPC"""
+        fields = [field for field in fields if field not in self._values]
+        if fields:
+            try:
+                records = self._model_view.read([self._id], fields)
+            except OdooException as e:
+                raise OdooRequestError(f"Failed to fetch fields {', '.join(fields)}: {str(e)}")
+            if records:
+                self._values.update(records[0])
+        return self
+
     def write(self, values: dict) -> bool:
-        result = self._api.env(self._model).write([self._id], values)
+        result = self._model_view.write([self._id], values)
         if result:
-            self._values.update(values)
+            self._forget(values)
         return result
 
+    def _forget(self, fields):
+        """Drop values of written ``fields``; the server may have normalised them, and x2many ones are commands"""
+        for field in fields:
+            self._values.pop(field, None)
+
     def unlink(self) -> bool:
-        return self._api.env(self._model).unlink([self._id])
+        return self._model_view.unlink([self._id])
+
+
+def _read_into(model: 'OdooModel', records: List[OdooRecord], fields: List[str]):
+    """Load ``fields`` into those of ``records`` that lack any of them, in a single read"""
+    missing = [record for record in records if any(field not in record._values for field in fields)]
+    if missing:
+        fields = [field for field in fields if any(field not in record._values for record in missing)]
+        try:
+            rows = model.read([record._id for record in missing], fields)
+        except OdooException as e:
+            raise OdooRequestError(f"Failed to fetch fields {', '.join(fields)}: {str(e)}")
+        rows = {row['id']: row for row in rows}
+        for record in missing:
+            record._values.update(rows.get(record._id, ()))
+
+
+class OdooRecordSet(list):
+    """List of :class:`OdooRecord` of one model whose fields are loaded for all records at once"""
+
+    def __init__(self, model: 'OdooModel', records: List[OdooRecord] = ()):
+        super().__init__(records)
+        self._model = model
+        for record in self:
+            record._prefetch = self
+
+    @property
+    def ids(self) -> List[int]:
+        return [record._id for record in self]
+
+    def prefetch(self, fields: List[str]) -> 'OdooRecordSet':
+        """Load the given fields of every record in a single read"""
+        _read_into(self._model, self, fields)
+        return self
+
+    def mapped(self, field: str) -> List[Any]:
+        """Return the value of ``field`` for every record, reading it in one RPC if needed"""
+        self.prefetch([field])
+        return [record._values.get(field) for record in self]
 
 
 class OdooModel:
+    __slots__ = ('_api', '_model', '_context')
+
     def __init__(self, api, model: str, context: dict = None):
         self._api = api
         self._model = model
-        self._context = context or api.context.copy()
-
-    def _handle_response(self, response: Optional[dict], error_msg: str) -> Any:
-        """Helper method to handle API responses"""
-        if not response:
-            raise OdooRequestError(error_msg)
-        if 'error' in response:
-            raise OdooRequestError(error_msg, response['error'])
-        return response.get('result', False)
+        # Without an explicit context, follow the API's live context
+        self._context = context or api.context
 
     def with_context(self, *args, **kwargs) -> 'OdooModel':
-        context = self._context.copy()
-        if args and isinstance(args[0], dict):
-            context.update(args[0])
-        context.update(kwargs)
-        return OdooModel(self._api, self._model, context)
+        # Layered over the current context, which is shared rather than copied
+        context = _with_context(self._context, args, kwargs)
+        return self if context is None else OdooModel(self._api, self._model, context)
+
+    def _call(self, method: str, args: List, kwargs: Dict = None) -> Any:
+        """Call ``method`` on the model with the model's context merged into ``kwargs``, which it may modify"""
+        return self._api._call_kw(self._model, method, args, _set_context(self._context, kwargs or {}))
+
+    def _cached_call(self, method: str, args: List, kwargs: Dict, use_cache: bool = True) -> Any:
+        """Like :meth:`_call`, serving repeated identical calls from the API's result cache"""
+        cache = self._api.cache
+        if not use_cache or not cache.ttl:
+            return self._call(method, args, kwargs)
+
+        kwargs = _set_context(self._context, kwargs)
+        key = (self._model, method, _freeze(args), _freeze(kwargs))
+        result = cache.get(key)
+        if result is None:
+            result = self._api._call_kw(self._model, method, args, kwargs)
+            cache.set(key, result)
+        return result
 
     def __getattr__(self, name):
+        # Unset slots and Python protocol probes (copy, pickle, hasattr) are never RPCs
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        call_kw, model, context = self._api._call_kw, self._model, self._context
+
         def method_call(*args, **kwargs):
-            endpoint = f"/web/dataset/call_kw/{self._model}/{name}"
-            kwargs = kwargs.copy()
-
-            if 'context' in kwargs:
-                ctx = self._context.copy()
-                ctx.update(kwargs['context'])
-                kwargs['context'] = ctx
-            else:
-                kwargs['context'] = self._context
-
-            payload = {
-                "params": {
-                    "model": self._model,
-                    "method": name,
-                    "args": list(args),
-                    "kwargs": kwargs
-                }
-            }
-            response = self._api._make_request(endpoint, payload)
-            return response.get("result", False) if response else False
+            return call_kw(model, name, list(args), _set_context(context, kwargs))
 
         return method_call
 
-    def browse(self, ids: Union[int, List[int]]) -> Union[OdooRecord, List[OdooRecord]]:
+    def parallel(self, calls: List[tuple], max_workers: int = 8) -> List[Any]:
+        """
+        Run several independent calls on the model concurrently; see :meth:`OdooAPI.call_batch`.
+
+        Args:
+            calls: ``(method, args, kwargs)`` tuples; ``args`` and ``kwargs`` may be omitted
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            list: Results in the same order as ``calls``
+        """
+        calls = [tuple(call) + (None,) * (3 - len(call)) for call in calls]
+        return self._api.call_batch([
+            (self._model, method, args, _merge_context(self._context, kwargs)) for method, args, kwargs in calls
+        ], max_workers)
+
+    def fields_get(self, allfields: List[str] = None, attributes: List[str] = None) -> Dict:
+        """Return the model's field definitions, fetched once per database, user and language"""
+        # Order and duplicates do not change the result, so they must not split the cache
+        allfields, attributes = tuple(sorted(set(allfields or ()))), tuple(sorted(set(attributes or ())))
+        self._api._ensure_session()  # The user is part of the cache key
+        uid, lang = self._api.context.get('uid'), self._context.get('lang')
+        cache = self._api._fields_cache
+        fields = cache.get(self._model, uid, lang, allfields, attributes)
+        if fields is not None:
+            return fields
+
+        complete = cache.get(self._model, uid, lang, (), ()) if allfields or attributes else None
+        if complete is not None:
+            # Narrow requests can be answered from complete definitions fetched earlier
+            fields = {
+                name: {attr: field[attr] for attr in attributes if attr in field} if attributes else field
+                for name, field in complete.items() if not allfields or name in allfields
+            }
+        else:
+            fields = self._call('fields_get', [], {
+                'allfields': list(allfields) or None,
+                'attributes': list(attributes) or None
+            }) or {}
+        cache.set(self._model, uid, lang, allfields, attributes, fields)
+        return fields
+
+    def field_names(self) -> set:
+        """Return the set of field names of the model, fetched once per database and user"""
+        names = self._api._field_names.get(self._model)
+        if names is None:
+            # Skip labels, help texts and selections: only names and what decides prefetching are needed
+            fields = self.fields_get(attributes=['type', 'store'])
+            names = set(fields)
+            self._api._field_names[self._model] = names
+            self._api._prefetch_fields[self._model] = [
+                name for name, field in fields.items()
+                if field.get('store') and field.get('type') not in _NO_PREFETCH_TYPES
+            ]
+        return names
+
+    def invalidate_fields_cache(self):
+        """Drop cached field definitions of the model, e.g. after a module upgrade"""
+        self._api._field_names.pop(self._model, None)
+        self._api._prefetch_fields.pop(self._model, None)
+        self._api._fields_cache.invalidate(self._model)
+
+    def browse(self, ids: Union[int, List[int]],
+               fields: List[str] = None) -> Union[OdooRecord, OdooRecordSet]:
+        """
+        Return records for ``ids`` without reading them.
+
+        Fields are loaded on first access, for all records browsed together. Pass
+        ``fields`` to load them for every record upfront in a single read.
+        """
         if isinstance(ids, int):
-            return OdooRecord(self._api, self._model, ids, context=self._context)
-        return [OdooRecord(self._api, self._model, id_, context=self._context) for id_ in ids]
+            records = self._record(ids)
+        else:
+            records = OdooRecordSet(self, [self._record(id_) for id_ in ids])
+        if fields:
+            records.prefetch(fields)
+        return records
+
+    def _record(self, record_id: int) -> OdooRecord:
+        """Return the record for ``record_id``, reusing the one browsed earlier while it is still referenced"""
+        if self._context is not self._api.context:
+            # Records of with_context() models must not share values or context with the default ones
+            return OdooRecord(self._api, self._model, record_id, context=self._context)
+        records = self._api._records.get(self._model)
+        if records is None:
+            records = self._api._records[self._model] = weakref.WeakValueDictionary()
+        record = records.get(record_id)
+        if record is None:
+            record = records[record_id] = OdooRecord(self._api, self._model, record_id, context=self._context)
+        return record
+
+    def _peers(self, record: OdooRecord) -> List[OdooRecord]:
+        """``record`` and up to ``_PREFETCH_MAX - 1`` other records of the model that were browsed on their own"""
+        peers = [record]
+        if record._context is self._api.context:
+            for other in list(self._api._records.get(self._model, {}).values()):
+                if len(peers) >= _PREFETCH_MAX:
+                    break
+                if other is not record and other._prefetch is None:
+                    peers.append(other)
+        return peers
+
+    def _invalidate_records(self, ids: List[int], fields=None):
+        """Forget values of browsed records that a write made stale, or the records themselves after an unlink"""
+        records = self._api._records.get(self._model, {})
+        for id_ in [ids] if isinstance(ids, int) else ids:
+            # Unlinked records leave the registry so they are no longer read along with other records
+            record = records.get(id_) if fields is not None else records.pop(id_, None)
+            if record is not None:
+                if fields is None:
+                    record._values.clear()
+                else:
+                    for field in fields:
+                        record._values.pop(field, None)
 
     def search(self, domain: List = None, offset: int = 0, limit: Optional[int] = None,
-               order: Optional[str] = None) -> List[int]:
+               order: Optional[str] = None, use_cache: bool = True) -> List[int]:
         try:
-            endpoint = "/web/dataset/call_kw/" + self._model + "/search"
-            payload = {
-                "params": {
-                    "model": self._model,
-                    "method": "search",
-                    "args": [domain or []],
-                    "kwargs": {
-                        "offset": offset,
-                        "limit": limit,
-                        "order": order,
-                    }
-                }
-            }
-            response = self._api._make_request(endpoint, payload)
-            return self._handle_response(response, f"Search failed for model {self._model}")
+            return self._cached_call('search', [domain or []], {
+                "offset": offset,
+                "limit": limit,
+                "order": order,
+            }, use_cache)
         except OdooException as e:
             raise OdooRequestError(f"Search operation failed: {str(e)}")
 
     def search_read(self, domain: List = None, fields: List[str] = None,
                     offset: int = 0, limit: Optional[int] = None,
-                    order: Optional[str] = None) -> List[Dict]:
-        endpoint = "/web/dataset/call_kw/" + self._model + "/search_read"
-        payload = {
-            "params": {
-                "model": self._model,
-                "method": "search_read",
-                "args": [domain or []],
-                "kwargs": {
-                    "fields": fields or ['name'],
-                    "offset": offset,
-                    "limit": limit,
-                    "order": order,
-                }
-            }
-        }
-        response = self._api._make_request(endpoint, payload)
-        return response.get("result", []) if response else []
+                    order: Optional[str] = None, use_cache: bool = True) -> List[Dict]:
+        return self._cached_call('search_read', [domain or []], {
+            "fields": fields or ['name'],
+            "offset": offset,
+            "limit": limit,
+            "order": order,
+        }, use_cache) or []
+
+    def search_browse(self, domain: List = None, fields: List[str] = None, offset: int = 0,
+                      limit: Optional[int] = None, order: Optional[str] = None) -> OdooRecordSet:
+        """
+        Return the matching records with ``fields`` already loaded, using a single ``search_read``.
+
+        Replaces ``search`` followed by ``browse`` and attribute access, which
+        costs a read per record and field instead.
+        """
+        rows = self.search_read(domain, fields, offset=offset, limit=limit, order=order, use_cache=False)
+        records = OdooRecordSet(self, [self._record(row['id']) for row in rows])
+        for record, row in zip(records, rows):
+            record._values.update(row)
+        return records
+
+    def iter_search_read(self, domain: List = None, fields: List[str] = None,
+                         order: Optional[str] = None, chunk: int = 1000) -> Iterator[Dict]:
+        """
+        Yield matching records, fetching them ``chunk`` rows per request.
+
+        Memory stays bounded by ``chunk`` instead of the total number of rows,
+        which matters for large exports. The next page is requested while the
+        current one is being consumed. Pages are ordered by ``id`` unless
+        another ``order`` is given, so they do not overlap.
+        """
+        if chunk <= 0:
+            raise OdooValidationError("chunk must be a positive number of rows")
+
+        def fetch(offset: int) -> List[Dict]:
+            return self.search_read(domain, fields, offset=offset, limit=chunk, order=order or 'id', use_cache=False)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            page = executor.submit(fetch, offset)
+            while True:
+                records = page.result()
+                if len(records) < chunk:
+                    yield from records
+                    return
+                offset += chunk
+                page = executor.submit(fetch, offset)
+                yield from records
+        finally:
+            # Consumer stopped early: return without waiting for the prefetched page
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def create(self, values: Dict) -> int:
         try:
-            endpoint = "/web/dataset/call_kw/" + self._model + "/create"
-            payload = {
-                "params": {
-                    "model": self._model,
-                    "method": "create",
-                    "args": [values],
-                    "kwargs": {}
-                }
-            }
-            response = self._api._make_request(endpoint, payload)
-            result = self._handle_response(response, f"Create failed for model {self._model}")
+            result = self._call('create', [values])
             if not result:
                 raise OdooValidationError("Create operation returned no ID")
             return result
@@ -243,59 +748,45 @@ class OdooModel:
             raise OdooRequestError(f"Create operation failed: {str(e)}")
 
     def write(self, ids: List[int], values: Dict) -> bool:
-        endpoint = "/web/dataset/call_kw/" + self._model + "/write"
-        payload = {
-            "params": {
-                "model": self._model,
-                "method": "write",
-                "args": [ids, values],
-                "kwargs": {}
-            }
-        }
-        response = self._api._make_request(endpoint, payload)
-        return response.get("result", False) if response else False
+        result = self._call('write', [ids, values])
+        self._invalidate_records(ids, values)
+        return result
 
     def unlink(self, ids: List[int]) -> bool:
-        endpoint = "/web/dataset/call_kw/" + self._model + "/unlink"
-        payload = {
-            "params": {
-                "model": self._model,
-                "method": "unlink",
-                "args": [ids],
-                "kwargs": {}
-            }
-        }
-        response = self._api._make_request(endpoint, payload)
-        return response.get("result", False) if response else False
+        result = self._call('unlink', [ids])
+        self._invalidate_records(ids)
+        return result
+
+    def read(self, ids: List[int], fields: List[str] = None, use_cache: bool = True) -> List[Dict]:
+        return self._cached_call('read', [ids], {"fields": fields or ['name']}, use_cache) or []
 
-    def read(self, ids: List[int], fields: List[str] = None) -> List[Dict]:
-        endpoint = "/web/dataset/call_kw/" + self._model + "/read"
-        payload = {
-            "params": {
-                "model": self._model,
-                "method": "read",
-                "args": [ids],
-                "kwargs": {
-                    "fields": fields or ['name']
-                }
-            }
-        }
-        response = self._api._make_request(endpoint, payload)
-        return response.get("result", []) if response else []
+
+class _ModelCache(dict):
+    """Model name -> model proxy mapping that builds missing proxies on lookup"""
+
+    def __init__(self, api, factory):
+        super().__init__()
+        self._api = api
+        self._factory = factory
+
+    def __missing__(self, model: str):
+        proxy = self[model] = self._factory(self._api, model)
+        return proxy
 
 
 class OdooAPI:
-    def __init__(self, url: str, db: str = None, username: str = None, password: str = None, session_id: str = None):
+    def __init__(self, url: str, db: str = None, username: str = None, password: str = None, session_id: str = None,
+                 cache_ttl: float = 0, max_connections: int = 20, retries: int = 3,
+                 client: httpx.Client = None, fields_cache_dir: str = None):
         if not url:
             raise OdooValidationError("URL cannot be empty")
-        if not any([session_id, all([db, username, password])]):
+        if not (session_id or (db and username and password)):
             raise OdooValidationError("Either session_id or (db, username, password) must be provided")
 
         self.url = url.rstrip('/')
         self.db = db
         self.username = username
         self.password = password
-        self.session_id = session_id
         self.context = {
             "lang": "en_US",
             "tz": "Asia/Riyadh",
@@ -303,19 +794,77 @@ class OdooAPI:
         }
         self._last_validation = 0
         self._validation_interval = 60
-        try:
-            self._client = httpx.Client(verify=False)
-        except Exception as e:
-            raise OdooConnectionError(f"Failed to initialize HTTP client: {str(e)}")
+        self._session_key = _session_key(self.url, db, username, password)
+        self._fields_cache = FieldsCache(self.url, db, fields_cache_dir)
+        self._field_names = {}  # model -> set of field names
+        self._prefetch_fields = {}  # model -> stored fields loaded together on first field access
+        self.cache = ResultCache(cache_ttl)
+        self._models = _ModelCache(self, OdooModel)
+        self._records = {}  # model -> {id: record} (weak values), so browse() reuses loaded values
+        self._rpc_id = itertools.count(1)  # JSON-RPC request ids, unique per API instance
+        self._call_kw_templates = {}  # (model, method) -> (url, encoded payload up to the args)
+        self._login_lock = threading.Lock()  # Lets one thread log in while concurrent calls wait for it
+        self._write_buffer = None  # records with assignments to write, as dict keys, while inside batch()
+        self._owns_client = client is None
+        if client is not None:
+            # Share the caller's pool, e.g. between APIs of several users on one server
+            self._client = client
+        else:
+            try:
+                # One pooled transport per API instance so consecutive RPCs reuse
+                # keep-alive connections instead of paying a TCP/TLS handshake each.
+                self._client = httpx.Client(
+                    headers=_JSON_HEADERS,
+                    timeout=_TIMEOUT,
+                    transport=httpx.HTTPTransport(
+                        verify=False,
+                        http2=_HTTP2,
+                        retries=retries,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=max_connections,
+                            max_connections=max_connections,
+                            keepalive_expiry=_KEEPALIVE_EXPIRY
+                        )
+                    )
+                )
+            except Exception as e:
+                raise OdooConnectionError(f"Failed to initialize HTTP client: {str(e)}")
+            # Safety net for APIs that are never closed: runs once, when collected or at interpreter exit
+            self._close_client = weakref.finalize(self, self._client.close)
+        self._send_request = self._client.send
+        # Requests are built complete and sent directly, skipping the client's per-request merging of
+        # URL, headers, cookies and timeout. Above all, the client's cookie jar never reaches the wire:
+        # httpx fills it from every response, so on a shared client it holds other users' sessions.
+        self._request_extensions = {"timeout": self._client.timeout.as_dict()}
+        self._base_headers = httpx.Headers(self._client.headers)
+        self._base_headers.update(_JSON_HEADERS)
+        self.session_id = session_id
 
-    def __del__(self):
-        try:
-            self._client.close()
-        except Exception:
-            pass
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._session_id
+
+    @session_id.setter
+    def session_id(self, value: Optional[str]):
+        self._session_id = value
+        # Cookie header sent with every request, rebuilt only when the session changes
+        self._session_headers = {'Cookie': f'session_id={value}'} if value else {}
+        self._request_headers = self._base_headers.copy()
+        self._request_headers.update(self._session_headers)
+
+    def __enter__(self) -> 'OdooAPI':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP client and release pooled connections, unless it was passed in"""
+        if self._owns_client:
+            self._close_client()
 
     def env(self, model: str) -> OdooModel:
-        return OdooModel(self, model)
+        return self._models[model]
 
     def validate_session(self) -> bool:
         current_time = time.time()
@@ -327,25 +876,16 @@ class OdooAPI:
             return False
 
         endpoint = "/web/session/get_session_info"
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Cookie': f'session_id={self.session_id}'
-        }
         payload = {
             "jsonrpc": "2.0",
             "params": {}
         }
 
         try:
-            response = self._client.post(
-                self.url + endpoint,
-                headers=headers,
-                json=payload
-            )
+            response = self._post(self.url + endpoint, _dumps(payload), self._request_headers)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 if result.get('result', {}).get('uid'):
                     self.context['uid'] = result['result']['uid']
                     self._last_validation = current_time
@@ -353,13 +893,20 @@ class OdooAPI:
             return False
 
         except httpx.HTTPError as e:
-            print(f"Session validation error: {str(e)}")
+            _logger.warning("Session validation error: %s", e)
             return False
 
     def connect(self) -> bool:
         if self.session_id and self.validate_session():
             return True
 
+        cached = _cached_session(self._session_key)
+        if cached and cached[0] != self.session_id:
+            # Another API logged in with the same credentials recently; reuse its session
+            self.session_id, self.context['uid'] = cached
+            self._last_validation = time.time()
+            return True
+
         login_endpoint = "/web/session/authenticate"
         payload = {
             "jsonrpc": "2.0",
@@ -370,87 +917,254 @@ class OdooAPI:
             }
         }
 
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-
         try:
-            response = self._client.post(
-                self.url + login_endpoint,
-                headers=headers,
-                json=payload
-            )
+            # Sent without any session: one picked up from elsewhere could be rebound to this user
+            response = self._post(self.url + login_endpoint, _dumps(payload), self._base_headers)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 if result.get('result'):
                     self.session_id = response.cookies.get('session_id')
                     self.context['uid'] = result['result'].get('uid')
+                    self._last_validation = time.time()
+                    if self.session_id:
+                        _store_session(self._session_key, self.session_id, self.context['uid'])
                     return True
             return False
 
         except httpx.HTTPError as e:
-            print(f"Connection error: {str(e)}")
+            _logger.warning("Connection error: %s", e)
             return False
 
-    def _make_request(self, endpoint: str, payload: dict) -> Optional[dict]:
-        if not self.session_id or not self.validate_session():
+    def _ensure_session(self):
+        # Sessions are trusted until the server rejects them; see _reauthenticate
+        if not self.session_id:
+            with self._login_lock:
+                if not self.session_id and not self.connect():
+                    raise OdooAuthenticationError("Failed to establish or validate session")
+
+    def _reauthenticate(self, rejected: Optional[str], expired: bool = False):
+        """Re-establish the session after the server rejected ``rejected``, the one a request was sent with"""
+        with self._login_lock:
+            if self.session_id != rejected:
+                return  # Another thread already logged in again while this request was in flight
+            _drop_session(self._session_key, rejected)
+            if expired:
+                self.session_id = None  # Known to be dead: log in again without validating it first
+            self._last_validation = 0  # Force a real check instead of trusting the cached validation
             if not self.connect():
-                raise OdooAuthenticationError("Failed to establish or validate session")
+                raise OdooAuthenticationError("Session expired and re-authentication failed")
+
+    def _request(self, url: str, body: bytes) -> dict:
+        """Post an encoded JSON-RPC request, re-authenticating once if the session expired"""
+        session_id = self.session_id
+        json_response = self._send(url, body)
+        if _is_session_expired(json_response):
+            self._reauthenticate(session_id, expired=True)
+            json_response = self._send(url, body)
+
+        if 'error' in json_response:
+            error_data = json_response['error']
+            error_msg = error_data.get('data', {}).get('message', str(error_data))
+            raise OdooRequestError(f"Odoo server error: {error_msg}", error_data)
+        return json_response
+
+    def _post(self, url: str, body: bytes, headers: httpx.Headers) -> httpx.Response:
+        return self._send_request(httpx.Request(
+            'POST', url, headers=headers, content=body, extensions=self._request_extensions))
+
+    def _send(self, url: str, body: bytes) -> dict:
+        session_id = self.session_id
+        try:
+            response = self._post(url, body, self._request_headers)
+            if response.status_code in (401, 403):
+                self._reauthenticate(session_id)
+                response = self._post(url, body, self._request_headers)
+            response.raise_for_status()
+            return _loads(response.content)
+        except httpx.TimeoutException:
+            raise OdooConnectionError("Request timed out")
+        except httpx.HTTPError as e:
+            raise OdooConnectionError(f"HTTP error occurred: {str(e)}")
+        except ValueError as e:
+            raise OdooRequestError(f"Invalid JSON response: {str(e)}")
 
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Cookie': f'session_id={self.session_id}'
-        }
+    def call_kw(self, model: str, method: str, args: List = None, kwargs: Dict = None) -> Any:
+        """Call ``method`` on ``model`` through ``/web/dataset/call_kw`` and return its result"""
+        return self._call_kw(model, method, list(args or []), dict(kwargs or {}))
 
-        payload["jsonrpc"] = "2.0"
-        if "params" in payload and "kwargs" in payload["params"]:
-            payload["params"]["kwargs"]["context"] = self.context
+    def _call_kw(self, model: str, method: str, args: list, kwargs: dict) -> Any:
+        """:meth:`call_kw` for internal callers, whose freshly built ``args`` and ``kwargs`` go into the payload as is"""
+        self._ensure_session()
+        kwargs.setdefault('context', self.context)
+        try:
+            url, prefix = self._call_kw_templates[model, method]
+        except KeyError:
+            # Everything but args, kwargs and id is the same for every call of a method: encode it once
+            url = f"{self.url}/web/dataset/call_kw/{model}/{method}"
+            prefix = _dumps({"jsonrpc": "2.0", "method": "call", "params": {"model": model, "method": method}})
+            prefix = prefix[:-2] + b',"args":'
+            self._call_kw_templates[model, method] = url, prefix
+        body = b''.join((prefix, _dumps(args), b',"kwargs":', _dumps(kwargs), b'},"id":%d}' % next(self._rpc_id)))
+        response = self._request(url, body)
+        if method not in _READ_ONLY_METHODS:
+            self.cache.clear()
+        return response.get("result", False) if response else False
 
+    @contextmanager
+    def batch(self):
+        """
+        Buffer attribute assignments on records and write them when the block exits.
+
+        Records that received identical values are written together, so a loop
+        like ``for rec in records: rec.state = 'done'`` costs a single write.
+        Buffered values are discarded if the block raises.
+        """
+        outermost = self._write_buffer is None
+        if outermost:
+            self._write_buffer = {}
         try:
-            response = self._client.post(
-                self.url + endpoint,
-                headers=headers,
-                json=payload,
-                timeout=30  # Add timeout
-            )
+            yield self
+            if outermost:
+                self.flush()
+        finally:
+            if outermost:
+                for record in self._write_buffer:
+                    record._dirty = {}  # Anything not written by now is discarded
+                self._write_buffer = None
+
+    def flush(self) -> bool:
+        """Write values buffered by :meth:`batch`, one write per model and distinct set of values"""
+        if not self._write_buffer:
+            return True
+        groups = {}  # (model, frozen values) -> (values, records)
+        for record in self._write_buffer:
+            if record._dirty:
+                key = (record._model_view, _freeze(record._dirty))
+                groups.setdefault(key, (record._dirty, []))[1].append(record)
+        for (model, _), (values, records) in groups.items():
+            if not model.write([record._id for record in records], values):
+                raise OdooValidationError(f"Failed to write values for fields: {', '.join(values)}")
+            for record in records:
+                record._forget(values)
+                record._dirty = {}
+        self._write_buffer.clear()
+        return True
+
+    def call_batch(self, calls: List[tuple], max_workers: int = 8) -> List[Any]:
+        """
+        Run several independent ``call_kw`` requests concurrently.
+
+        Odoo's JSON-RPC dispatcher does not accept batch (array) payloads, so the
+        calls are fanned out over the pooled connections instead: wall time is
+        roughly that of the slowest call rather than the sum of all of them.
+        Calls that depend on each other's results must not be batched.
+
+        Args:
+            calls: ``(model, method, args, kwargs)`` tuples; ``args`` and ``kwargs`` may be omitted
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            list: Results in the same order as ``calls``
+        """
+        calls = [tuple(call) + (None,) * (4 - len(call)) for call in calls]
+        if not calls:
+            return []
+
+        # Establish the session once instead of letting every worker race to log in
+        self._ensure_session()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [executor.submit(self.call_kw, *call) for call in calls]
+            return [future.result() for future in futures]
+
+    @contextmanager
+    def pipeline(self, max_workers: int = 8):
+        """
+        Send calls without waiting for each result before issuing the next.
+
+        The block receives ``submit(model, method, args=None, kwargs=None)``,
+        which starts the call on a worker thread and returns a
+        :class:`concurrent.futures.Future`. The block exits once every submitted
+        call has finished, raising the error of the first failed call if any.
+        Call ``.result()`` on a future before issuing a call that depends on it,
+        because submitted calls may run in any order.
+        """
+        self._ensure_session()
+        futures = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def submit(model: str, method: str, args: List = None, kwargs: Dict = None) -> Future:
+                future = executor.submit(self.call_kw, model, method, args, kwargs)
+                futures.append(future)
+                return future
+
+            yield submit
+        for future in futures:
+            future.result()  # Surface failures of calls whose result nobody asked for
+
+    def download_report(self, report_name: str, ids: List[int], filename: str,
+                        report_type: str = 'pdf') -> str:
+        """
+        Render a report and stream it to disk in 64 KiB chunks.
+
+        Args:
+            report_name: Technical name of the report, e.g. 'account.report_invoice'
+            ids: Record IDs to render into the report
+            filename: Destination file path
+            report_type: Report format, 'pdf' or 'html'
+
+        Returns:
+            str: The path of the written file
+        """
+        self._ensure_session()
+        url = f"{self.url}/report/{report_type}/{report_name}/{','.join(str(id_) for id_ in ids)}"
 
-            response.raise_for_status()  # Raise exception for bad HTTP status codes
+        try:
+            for attempt in range(2):
+                session_id = self.session_id
+                headers = httpx.Headers(self._client.headers)
+                headers.update(self._session_headers)
+                response = self._send_request(httpx.Request(
+                    'GET', url, headers=headers, extensions={"timeout": httpx.Timeout(120).as_dict()}), stream=True)
+                try:
+                    # An expired session is redirected to the login page
+                    if not attempt and (response.is_redirect or response.status_code in (401, 403)):
+                        self._reauthenticate(session_id, expired=response.is_redirect)
+                        continue
+                    response.raise_for_status()
+                    with open(filename, 'wb') as f:
+                        for chunk in response.iter_bytes(65536):
+                            f.write(chunk)
+                    return filename
+                finally:
+                    response.close()
+        except httpx.TimeoutException:
+            raise OdooConnectionError("Report download timed out")
+        except httpx.HTTPError as e:
+            raise OdooConnectionError(f"Report download failed: {str(e)}")
 
-            if response.status_code == 200:
-                json_response = response.json()
-                if 'error' in json_response:
-                    error_data = json_response['error']
-                    error_msg = error_data.get('data', {}).get('message', str(error_data))
-                    raise OdooRequestError(f"Odoo server error: {error_msg}", error_data)
-                return json_response
-
-            # Attempt to reconnect once
-            if self.connect():
-                headers['Cookie'] = f'session_id={self.session_id}'
-                response = self._client.post(
-                    self.url + endpoint,
-                    headers=headers,
-                    json=payload,
-                    timeout=30
-                )
-                if response.status_code == 200:
-                    return response.json()
+    def download_reports(self, jobs: List[tuple], max_workers: int = 8) -> List[str]:
+        """
+        Download several reports concurrently, each streamed to its own file.
 
-            raise OdooRequestError(f"Request failed with status code: {response.status_code}")
+        Args:
+            jobs: ``(report_name, ids, filename)`` tuples
+            max_workers: Maximum number of downloads in flight
 
-        except httpx.TimeoutError:
-            raise OdooConnectionError("Request timed out")
-        except httpx.HTTPError as e:
-            raise OdooConnectionError(f"HTTP error occurred: {str(e)}")
-        except Exception as e:
-            raise OdooRequestError(f"Unexpected error: {str(e)}")
+        Returns:
+            list: The written file paths, in the order of ``jobs``
+        """
+        if not jobs:
+            return []
+        self._ensure_session()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = [executor.submit(self.download_report, *job) for job in jobs]
+            return [future.result() for future in futures]
 
 
 def connect_odoo(url: str, db: str = None, username: str = None, password: str = None,
-                 session_id: str = None) -> tuple[Optional[OdooAPI], Optional[str]]:
+                 session_id: str = None, cache_ttl: float = 0, client: httpx.Client = None,
+                 fields_cache_dir: str = None) -> tuple[Optional[OdooAPI], Optional[str]]:
     """
     Connect to Odoo using either credentials or session ID.
 
@@ -460,15 +1174,19 @@ def connect_odoo(url: str, db: str = None, username: str = None, password: str =
         username: Username (optional if session_id is provided)
         password: Password (optional if session_id is provided)
         session_id: Existing session ID (optional if credentials are provided)
+        cache_ttl: Seconds to reuse results of identical search/search_read/read calls (0 disables)
+        client: Existing httpx.Client whose connection pool should be shared (optional)
+        fields_cache_dir: Directory where model field definitions are persisted across processes (optional)
 
     Returns:
         tuple: (OdooAPI instance, session_id) or (None, None) if connection fails
     """
     try:
-        api = OdooAPI(url=url, db=db, username=username, password=password, session_id=session_id)
+        api = OdooAPI(url=url, db=db, username=username, password=password, session_id=session_id,
+                      cache_ttl=cache_ttl, client=client, fields_cache_dir=fields_cache_dir)
         if api.connect():
             return api, api.session_id
         raise OdooAuthenticationError("Failed to connect to Odoo server")
     except OdooException as e:
-        print(f"Connection failed: {str(e)}")
+        _logger.error("Connection failed: %s", e)
         return None, None
\ No newline at end of file
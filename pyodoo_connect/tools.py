@@ -16,9 +16,12 @@ LINK = 4
 CLEAR = 5
 SET = 6
 
+# The only argument-less command; shared instead of built per call
+_CLEAR = (CLEAR, 0, 0)
+
 class Command:
-    @classmethod
-    def create(cls, values: dict):
+    @staticmethod
+    def create(values: dict):
         """
         Create new records in the comodel using ``values``, link the created
         records to ``self``.
@@ -35,8 +38,8 @@ class Command:
         """
         return (CREATE, 0, values)
 
-    @classmethod
-    def update(cls, id: int, values: dict):
+    @staticmethod
+    def update(id: int, values: dict):
         """
         Write ``values`` on the related record.
 
@@ -44,8 +47,8 @@ class Command:
         """
         return (UPDATE, id, values)
 
-    @classmethod
-    def delete(cls, id: int):
+    @staticmethod
+    def delete(id: int):
         """
         Remove the related record from the database and remove its relation
         with ``self``.
@@ -58,8 +61,8 @@ class Command:
         """
         return (DELETE, id, 0)
 
-    @classmethod
-    def unlink(cls, id: int):
+    @staticmethod
+    def unlink(id: int):
         """
         Remove the relation between ``self`` and the related record.
 
@@ -72,8 +75,8 @@ class Command:
         """
         return (UNLINK, id, 0)
 
-    @classmethod
-    def link(cls, id: int):
+    @staticmethod
+    def link(id: int):
         """
         Add a relation between ``self`` and the related record.
 
@@ -81,18 +84,18 @@ class Command:
         """
         return (LINK, id, 0)
 
-    @classmethod
-    def clear(cls):
+    @staticmethod
+    def clear():
         """
         Remove all records from the relation with ``self``. It behaves like
         executing the `unlink` command on every record.
 
         Return the command triple :samp:`(CLEAR, 0, 0)`
         """
-        return (CLEAR, 0, 0)
+        return _CLEAR
 
-    @classmethod
-    def set(cls, ids: list):
+    @staticmethod
+    def set(ids: list):
         """
         Replace the current relations of ``self`` by the given ones. It behaves
         like executing the ``unlink`` command on every removed relation then
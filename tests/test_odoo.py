@@ -6,8 +6,9 @@
 # Facebook: https://www.facebook.com/fasilwdr
 # Instagram: https://www.instagram.com/fasilwdr
 #############################################################################
+import asyncio
 import pytest
-from pyodoo_connect import connect_odoo, Command
+from pyodoo_connect import connect_odoo, connect_odoo_async, Command
 
 
 # Configuration for test environment
@@ -78,6 +79,14 @@ def test_partner_read(odoo_api, test_partner):
     assert partner.email == 'test@example.com'
 
 
+def test_partner_browse_many(odoo_api, test_partner):
+    """Test browsing several records and reading a field for all of them"""
+    partners = odoo_api.env('res.partner').browse([test_partner])
+    assert partners.ids == [test_partner]
+    assert partners.mapped('email') == ['test@example.com']
+    assert partners[0].email == 'test@example.com'
+
+
 def test_partner_update(odoo_api, test_partner):
     """Test updating partner data"""
     partner = odoo_api.env('res.partner').browse(test_partner)
@@ -91,6 +100,19 @@ def test_partner_update(odoo_api, test_partner):
     assert partner.phone == new_phone
 
 
+def test_partner_buffered_update(odoo_api, test_partner):
+    """Test attribute assignments are written together on block exit"""
+    partner = odoo_api.env('res.partner').browse(test_partner)
+    with partner:
+        partner.phone = '1111111111'
+        partner.email = 'buffered@example.com'
+        assert partner.phone == '1111111111'
+
+    partner = odoo_api.env('res.partner').browse(test_partner)
+    assert partner.phone == '1111111111'
+    assert partner.email == 'buffered@example.com'
+
+
 def test_partner_search(odoo_api):
     """Test search functionality"""
     # Search for partners
@@ -143,6 +165,33 @@ def test_command_operations(odoo_api):
     odoo_api.env('res.partner').unlink([partner_id])
 
 
+def test_call_batch(odoo_api, test_partner):
+    """Test concurrent independent calls keep their order"""
+    results = odoo_api.call_batch([
+        ('res.partner', 'read', [[test_partner]], {'fields': ['name']}),
+        ('res.partner', 'search_count', [[('id', '=', test_partner)]]),
+    ])
+    assert results[0][0]['name'] == 'Test Partner'
+    assert results[1] == 1
+
+
+def test_async_gather_reads(odoo_config, test_partner):
+    """Test concurrent reads through the async API"""
+    async def run():
+        api, session_id = await connect_odoo_async(**odoo_config)
+        if not api:
+            pytest.skip("Could not connect to Odoo server")
+        async with api:
+            return await api.gather_reads([
+                ('res.partner', [test_partner], ['name']),
+                ('res.partner', [test_partner], ['email']),
+            ])
+
+    names, emails = asyncio.run(run())
+    assert names[0]['name'] == 'Test Partner'
+    assert emails[0]['email'] == 'test@example.com'
+
+
 def test_error_handling(odoo_api):
     """Test error handling for invalid operations"""
     with pytest.raises(Exception):
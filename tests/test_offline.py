@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+#############################################################################
+# Author: Fasil
+# Email: fasilwdr@hotmail.com
+# WhatsApp: https://wa.me/966538952934
+# Facebook: https://www.facebook.com/fasilwdr
+# Instagram: https://www.instagram.com/fasilwdr
+#############################################################################
+"""Tests that run against an in-memory Odoo served through ``httpx.MockTransport``"""
+import asyncio
+import json
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from pyodoo_connect import AsyncOdooAPI, Command, connect_odoo
+from pyodoo_connect import odoo
+from pyodoo_connect.odoo import ResultCache, _dumps, _loads, _with_context
+
+
+class FakeOdoo:
+    """Minimal JSON-RPC server holding ``res.partner`` records in memory"""
+
+    FIELDS = {
+        'name': {'type': 'char', 'store': True, 'string': 'Name'},
+        'email': {'type': 'char', 'store': True, 'string': 'Email'},
+        'category_id': {'type': 'many2many', 'store': True, 'string': 'Tags'},
+    }
+
+    def __init__(self):
+        self.partners = {
+            1: {'name': 'A', 'email': 'a@x', 'category_id': [7]},
+            2: {'name': 'B', 'email': 'b@x', 'category_id': []},
+            3: {'name': 'C', 'email': 'c@x', 'category_id': []},
+        }
+        self.users = {'admin': 1, 'demo': 2}
+        self.sessions = {}  # session_id -> login
+        self.calls = []  # (method, args, kwargs) of every call_kw request
+        self.logins = 0
+        self.delay = 0  # Seconds each request takes, to let concurrent calls overlap
+        self.cookie_on_calls = False  # Set the session cookie on every response, as Odoo 15 and older do
+        self.login_cookies = []  # Cookie header of every authenticate request
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        body = json.loads(request.content) if request.content else {}
+        params = body.get('params', {})
+        if request.url.path == '/web/session/authenticate':
+            self.login_cookies.append(request.headers.get('Cookie'))
+            if params.get('login') not in self.users or params.get('password') != 'secret':
+                return httpx.Response(200, json={'jsonrpc': '2.0', 'result': False})
+            self.logins += 1
+            session_id = f"s{self.logins}"
+            self.sessions[session_id] = params['login']
+            return httpx.Response(200, json={'jsonrpc': '2.0', 'result': {'uid': self.users[params['login']]}},
+                                  headers={'Set-Cookie': f'session_id={session_id}; Path=/'})
+
+        session_id = request.headers.get('Cookie', '').partition('session_id=')[2]
+        login = self.sessions.get(session_id)
+        if login is None:
+            return self._error(body, 'Session expired', code=100, name='odoo.http.SessionExpiredException')
+        headers = {'Set-Cookie': f'session_id={session_id}; Path=/'} if self.cookie_on_calls else {}
+        if request.url.path.startswith('/report/'):
+            return httpx.Response(200, content=f'%PDF-{login}'.encode(), headers=headers)
+        if request.url.path == '/web/session/get_session_info':
+            return httpx.Response(200, json={'jsonrpc': '2.0', 'id': body.get('id'),
+                                             'result': {'uid': self.users[login]}})
+
+        method, args, kwargs = params['method'], params['args'], params['kwargs']
+        self.calls.append((method, args, kwargs))
+        try:
+            result = getattr(self, method)(*args, **{k: v for k, v in kwargs.items() if k != 'context'})
+        except LookupError as e:
+            return self._error(body, str(e))
+        return httpx.Response(200, json={'jsonrpc': '2.0', 'id': body.get('id'), 'result': result}, headers=headers)
+
+    @staticmethod
+    def _error(body: dict, message: str, code: int = 200, name: str = 'odoo.exceptions.UserError'):
+        return httpx.Response(200, json={'jsonrpc': '2.0', 'id': body.get('id'), 'error': {
+            'code': code, 'message': 'Odoo Server Error', 'data': {'name': name, 'message': message}}})
+
+    def methods(self, name: str) -> list:
+        return [call for call in self.calls if call[0] == name]
+
+    def fields_get(self, allfields=None, attributes=None):
+        return {
+            name: {attr: field[attr] for attr in attributes if attr in field} if attributes else dict(field)
+            for name, field in self.FIELDS.items() if not allfields or name in allfields
+        }
+
+    def read(self, ids, fields=None):
+        missing = [id_ for id_ in ids if id_ not in self.partners]
+        if missing:
+            raise LookupError("Record does not exist or has been deleted.")
+        return [{'id': id_, **{field: self.partners[id_][field] for field in fields}} for id_ in ids]
+
+    def search(self, domain, offset=0, limit=None, order=None):
+        ids = sorted(self.partners)[offset:]
+        return ids[:limit] if limit else ids
+
+    def search_read(self, domain, fields=None, offset=0, limit=None, order=None):
+        return self.read(self.search(domain, offset, limit), fields)
+
+    def search_count(self, domain):
+        return len(self.partners)
+
+    def write(self, ids, values):
+        for id_ in [ids] if isinstance(ids, int) else ids:
+            for field, value in values.items():
+                if field == 'category_id':
+                    for command in value:
+                        if command[0] == 5:
+                            self.partners[id_][field] = []
+                else:
+                    self.partners[id_][field] = value
+        return True
+
+    def unlink(self, ids):
+        for id_ in [ids] if isinstance(ids, int) else ids:
+            del self.partners[id_]
+        return True
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches():
+    # Logins and field definitions are shared process-wide; start every test from scratch
+    odoo._SESSIONS.clear()
+    odoo._FIELDS_MEMORY.clear()
+    yield
+    odoo._SESSIONS.clear()
+    odoo._FIELDS_MEMORY.clear()
+
+
+@pytest.fixture
+def server():
+    return FakeOdoo()
+
+
+def make_api(server, username='admin', **kwargs):
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    api, session_id = connect_odoo('https://odoo.test', 'db', username, 'secret', client=client, **kwargs)
+    assert api is not None
+    return api
+
+
+def test_dumps_odoo_types():
+    """Values JSON has no type for are encoded the way Odoo expects them"""
+    aware = datetime(2024, 1, 1, 15, 30, tzinfo=timezone(timedelta(hours=3)))
+    payload = _loads(_dumps({
+        'aware': aware,
+        'naive': datetime(2024, 1, 1, 12, 30),
+        'day': date(2024, 1, 2),
+        'amount': Decimal('1.5'),
+        'data': b'\x00\x01',
+        'context': ChainMap({'lang': 'ar_001'}, {'lang': 'en_US', 'tz': 'UTC'}),
+    }))
+    assert payload['aware'] == '2024-01-01 12:30:00'
+    assert payload['naive'] == '2024-01-01 12:30:00'
+    assert payload['day'] == '2024-01-02'
+    assert payload['amount'] == 1.5
+    assert payload['data'] == 'AAE='
+    assert payload['context'] == {'lang': 'ar_001', 'tz': 'UTC'}
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        _dumps({'value': object()})
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(ttl=60, maxsize=2)
+    cache.set(('a',), 1)
+    cache.set(('b',), 2)
+    assert cache.get(('a',)) == 1  # 'b' is now the least recently used
+    cache.set(('c',), 3)
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) == 1
+    assert cache.get(('c',)) == 3
+
+
+def test_result_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(odoo.time, 'monotonic', lambda: now[0])
+    cache = ResultCache(ttl=10)
+    cache.set(('a',), 1)
+    now[0] += 9
+    assert cache.get(('a',)) == 1
+    now[0] += 2
+    assert cache.get(('a',)) is None
+
+
+def test_result_cache_is_thread_safe():
+    """Lookups racing with clear() from other threads never fail"""
+    cache = ResultCache(ttl=60, maxsize=8)
+
+    def work(worker: int):
+        for i in range(2000):
+            key = (i % 16,)
+            cache.set(key, i)
+            cache.get(key)
+            if worker == 0 and not i % 7:
+                cache.clear()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(work, worker) for worker in range(4)]:
+            future.result()
+
+
+def test_result_cache_hits_are_copies(server):
+    """Modifying a cached result does not change what later calls return"""
+    api = make_api(server, cache_ttl=60)
+    partners = api.env('res.partner')
+    rows = partners.read([1], ['name'])
+    rows[0]['name'] = 'changed'
+    assert partners.read([1], ['name']) == [{'id': 1, 'name': 'A'}]
+    assert len(server.methods('read')) == 1
+
+
+def test_result_cache_disabled_without_ttl():
+    cache = ResultCache()
+    cache.set(('a',), 1)
+    assert cache.get(('a',)) is None
+
+
+def test_with_context_layers_values():
+    base = {'lang': 'en_US', 'tz': 'UTC'}
+    context = _with_context(base, ({'lang': 'ar_001'},), {'active_test': False})
+    assert dict(context) == {'lang': 'ar_001', 'tz': 'UTC', 'active_test': False}
+    assert base == {'lang': 'en_US', 'tz': 'UTC'}
+    # Unchanged values produce no new context
+    assert _with_context(base, (), {'lang': 'en_US'}) is None
+    assert _with_context(context, (), {'active_test': False}) is None
+
+
+def test_model_with_context_returns_self_when_unchanged(server):
+    api = make_api(server)
+    partners = api.env('res.partner')
+    assert partners.with_context(lang='en_US') is partners
+    arabic = partners.with_context(lang='ar_001')
+    assert arabic is not partners
+    arabic.search_count([])
+    assert server.methods('search_count')[-1][2]['context']['lang'] == 'ar_001'
+
+
+def test_session_reused_across_apis(server):
+    """A second API with the same credentials reuses the first one's login"""
+    first = make_api(server)
+    second = make_api(server)
+    assert server.logins == 1
+    assert second.session_id == first.session_id
+    assert second.context['uid'] == 1
+
+    # Other credentials never pick up the cached session
+    other = make_api(server, username='demo')
+    assert server.logins == 2
+    assert other.session_id != first.session_id
+
+
+def test_rejected_cached_session_logs_in_again(server):
+    first = make_api(server)
+    server.sessions.clear()  # Server restarted: every session is gone
+    second = make_api(server)
+    assert second.env('res.partner').search_count([]) == 3
+    assert server.logins == 2
+    assert second.session_id != first.session_id
+    assert odoo._cached_session(second._session_key)[0] == second.session_id
+
+
+def test_fields_cache_is_per_user_and_language(server, tmp_path):
+    """Field definitions depend on the user's groups and language, so they are not shared across either"""
+    admin = make_api(server, fields_cache_dir=str(tmp_path))
+    admin.env('res.partner').fields_get()
+    admin.env('res.partner').fields_get()
+    assert len(server.methods('fields_get')) == 1
+
+    make_api(server, username='demo', fields_cache_dir=str(tmp_path)).env('res.partner').fields_get()
+    assert len(server.methods('fields_get')) == 2
+
+    admin.env('res.partner').with_context(lang='ar_001').fields_get()
+    assert len(server.methods('fields_get')) == 3
+    assert server.methods('fields_get')[-1][2]['context']['lang'] == 'ar_001'
+
+    # A later process reuses the definitions persisted for its own user only
+    odoo._FIELDS_MEMORY.clear()
+    make_api(server, username='demo', fields_cache_dir=str(tmp_path)).env('res.partner').fields_get()
+    assert len(server.methods('fields_get')) == 3
+
+
+def test_record_context_applies_to_reads_and_writes(server):
+    api = make_api(server)
+    partner = api.env('res.partner').with_context(lang='ar_001').browse(1)
+    assert partner.name == 'A'
+    assert server.methods('fields_get')[-1][2]['context']['lang'] == 'ar_001'
+    assert server.methods('read')[-1][2]['context']['lang'] == 'ar_001'
+
+    api.env('res.partner').browse(2).with_context(lang='fr_FR').write({'name': 'B2'})
+    assert server.methods('write')[-1][2]['context']['lang'] == 'fr_FR'
+    assert api.env('res.partner').browse(2).name == 'B2'
+
+
+def test_write_reloads_written_fields(server):
+    """Written values are read back from the server instead of cached as sent"""
+    api = make_api(server)
+    partner = api.env('res.partner').browse(1)
+    assert partner.category_id == [7]
+    partner.write({'category_id': [Command.clear()]})
+    assert api.env('res.partner').browse(1).category_id == []
+
+    partner.name = 'A2'
+    partner.email = 'a2@x'
+    assert api.env('res.partner').browse(1).name == 'A2'
+    assert partner.email == 'a2@x'
+
+
+def test_record_block_writes_once_or_discards(server):
+    api = make_api(server)
+    partner = api.env('res.partner').browse(3)
+    with partner:
+        partner.name = 'C2'
+        partner.email = 'c2@x'
+        assert partner.name == 'C2'
+    assert [call[1] for call in server.methods('write')] == [[[3], {'name': 'C2', 'email': 'c2@x'}]]
+
+    with pytest.raises(RuntimeError):
+        with partner:
+            partner.name = 'lost'
+            raise RuntimeError
+    assert partner.name == 'C2'
+    with partner:
+        partner.email = 'c3@x'
+    assert server.partners[3] == {'name': 'C2', 'email': 'c3@x', 'category_id': []}
+
+
+def test_api_batch_groups_writes_and_discards_on_error(server):
+    api = make_api(server)
+    partners = api.env('res.partner').browse([1, 2, 3])
+    with api.batch():
+        for partner in partners:
+            partner.email = 'same@x'
+        assert partners[0].email == 'same@x'
+        assert not server.methods('write')
+    assert [call[1] for call in server.methods('write')] == [[[1, 2, 3], {'email': 'same@x'}]]
+    assert api.env('res.partner').browse(2).email == 'same@x'
+
+    with pytest.raises(RuntimeError):
+        with api.batch():
+            partners[1].email = 'lost@x'
+            raise RuntimeError
+    assert partners[1].email == 'same@x'
+    assert api.env('res.partner').browse(2).email == 'same@x'
+    assert len(server.methods('write')) == 1
+
+
+def test_peer_records_read_together(server):
+    api = make_api(server)
+    first, second = api.env('res.partner').browse(1), api.env('res.partner').browse(2)
+    assert first.name == 'A'
+    assert second.name == 'B'
+    assert [call[1][0] for call in server.methods('read')] == [[1, 2]]
+
+
+def test_unlinked_record_leaves_peer_reads(server):
+    api = make_api(server)
+    first, second = api.env('res.partner').browse(1), api.env('res.partner').browse(2)
+    first.unlink()
+    assert second.name == 'B'
+    assert api.env('res.partner').browse(1) is not first
+
+
+def test_failing_peer_falls_back_to_single_read(server):
+    api = make_api(server)
+    first, second, third = [api.env('res.partner').browse(id_) for id_ in (1, 2, 3)]
+    del server.partners[1]  # Deleted by another client
+    assert second.name == 'B'
+    assert [call[1][0] for call in server.methods('read')] == [[2, 1, 3], [2]]
+
+    # The deleted record is no longer read along with the others: one read per access
+    assert third.name == 'C'
+    assert second.email == 'b@x'
+    assert [call[1][0] for call in server.methods('read')] == [[2, 1, 3], [2], [3]]
+    with pytest.raises(odoo.OdooRequestError):
+        first.name
+    assert [call[1][0] for call in server.methods('read')][-1] == [1]
+
+
+def test_pipeline_raises_failed_calls(server):
+    api = make_api(server)
+    with api.pipeline() as submit:
+        count = submit('res.partner', 'search_count', [[]])
+    assert count.result() == 3
+
+    with pytest.raises(odoo.OdooRequestError):
+        with api.pipeline() as submit:
+            submit('res.partner', 'read', [[99]], {'fields': ['name']})
+
+
+def test_expired_session_logs_in_once_for_concurrent_calls(server):
+    api = make_api(server)
+    server.sessions.clear()
+    server.delay = 0.02
+    results = api.call_batch([('res.partner', 'search_count', [[]])] * 8)
+    assert results == [3] * 8
+    assert server.logins == 2
+
+
+async def make_async_api(handler) -> AsyncOdooAPI:
+    api = AsyncOdooAPI('https://odoo.test', 'db', 'admin', 'secret')
+    await api.aclose()
+    api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    api._client_post = api._client.post
+    return api
+
+
+def test_async_expired_session_logs_in_once(server):
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return server(request)
+
+    async def run():
+        api = await make_async_api(handler)
+        async with api:
+            assert await api.connect()
+            server.sessions.clear()
+            return await api.env('res.partner').bulk_call('search_count', [[[]]] * 8)
+
+    assert asyncio.run(run()) == [3] * 8
+    assert server.logins == 2
+
+
+def test_iter_search_read_pages(server):
+    api = make_api(server)
+    rows = list(api.env('res.partner').iter_search_read(fields=['name'], chunk=2))
+    assert [row['name'] for row in rows] == ['A', 'B', 'C']
+    assert [call[2]['offset'] for call in server.methods('search_read')] == [0, 2]
+    with pytest.raises(odoo.OdooValidationError):
+        next(api.env('res.partner').iter_search_read(chunk=0))
+
+
+def test_iter_search_read_stops_without_waiting(server):
+    api = make_api(server)
+    server.delay = 0.5
+    rows = api.env('res.partner').iter_search_read(fields=['name'], chunk=1)
+    assert next(rows)['name'] == 'A'  # The second page is now being fetched
+    started = time.monotonic()
+    rows.close()
+    assert time.monotonic() - started < 0.25
+
+
+def test_write_and_unlink_accept_a_single_id(server):
+    api = make_api(server)
+    partner = api.env('res.partner').browse(1)
+    assert partner.name == 'A'
+    assert api.env('res.partner').write(1, {'name': 'A2'})
+    assert partner.name == 'A2'
+    assert api.env('res.partner').unlink(2)
+    assert 2 not in server.partners
+
+
+def test_async_rejects_non_json_responses(server):
+    def handler(request):
+        if request.url.path.startswith('/web/dataset/call_kw'):
+            return httpx.Response(200, text='<html>Down for maintenance</html>')
+        return server(request)
+
+    async def run():
+        async with await make_async_api(handler) as api:
+            await api.env('res.partner').search_count([])
+
+    with pytest.raises(odoo.OdooRequestError):
+        asyncio.run(run())
+
+
+def test_shared_client_never_sends_another_users_session(server, tmp_path):
+    """Cookies the server sets on a shared client are never sent by another user's API"""
+    server.cookie_on_calls = True
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    headers = dict(client.headers)
+    alice, _ = connect_odoo('https://odoo.test', 'db', 'admin', 'secret', client=client)
+    assert alice.env('res.partner').search_count([]) == 3
+
+    bob, _ = connect_odoo('https://odoo.test', 'db', 'demo', 'secret', client=client)
+    assert server.login_cookies == [None, None]
+    assert server.sessions == {alice.session_id: 'admin', bob.session_id: 'demo'}
+    assert bob.env('res.partner').search_count([]) == 3
+    path = bob.download_report('base.report', [1], str(tmp_path / 'report.pdf'))
+    with open(path, 'rb') as f:
+        assert f.read() == b'%PDF-demo'
+    assert dict(client.headers) == headers